@@ -1,26 +1,57 @@
 """Store the exposed adapters."""
 
-from typing import Dict, TypeVar
+import importlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Type
 
 from .abstract import AbstractSource
-from .aws import AWSSource
-from .fake import FakeSource
-from .risk import RiskSource
 
-AdapterSource = TypeVar("AdapterSource", bound=AbstractSource)
+if TYPE_CHECKING:
+    from .aws import AWSSource
+    from .fake import FakeSource
+    from .risk import RiskSource
 
-# ignore: AdapterSource is unbound. I still don't know how to fix this
-AVAILABLE_SOURCES: Dict[str, AdapterSource] = {  # type: ignore
-    "risk": RiskSource,
-    "aws": AWSSource,
-    "fake": FakeSource,
+AdapterSource = AbstractSource
+
+# Import path of the available source adapters. They are imported when they are
+# used, as some of them, like the AWS one, take long to import.
+AVAILABLE_SOURCES: Dict[str, str] = {
+    "risk": "clinv.adapters.risk:RiskSource",
+    "aws": "clinv.adapters.aws:AWSSource",
+    "fake": "clinv.adapters.fake:FakeSource",
 }
 
 
-__all__ = [
+@lru_cache(maxsize=None)
+def get_source(source_name: str) -> Type[AbstractSource]:
+    """Import the class of a source adapter.
+
+    Args:
+        source_name: Name of the source adapter in AVAILABLE_SOURCES.
+
+    Returns:
+        The source adapter class.
+
+    Raises:
+        KeyError: If the source adapter doesn't exist.
+    """
+    module_name, class_name = AVAILABLE_SOURCES[source_name].split(":")
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import the source adapter classes when they are accessed."""
+    for source_name, source_path in AVAILABLE_SOURCES.items():
+        if source_path.endswith(f":{name}"):
+            return get_source(source_name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = (
     "AVAILABLE_SOURCES",
     "AbstractSource",
     "AWSSource",
     "FakeSource",
     "RiskSource",
-]
+    "get_source",
+)
@@ -1,9 +1,10 @@
 """Define the interface for the source adapters."""
 
 import abc
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from ..model.entity import EntityT, EntityUpdate
+if TYPE_CHECKING:
+    from ..model.entity import EntityT, EntityUpdate
 
 
 class AbstractSource(abc.ABC):
@@ -13,8 +14,8 @@ class AbstractSource(abc.ABC):
     def update(
         self,
         resource_types: Optional[List[str]] = None,
-        active_resources: Optional[List[EntityT]] = None,
-    ) -> List[EntityUpdate]:
+        active_resources: Optional[List["EntityT"]] = None,
+    ) -> List["EntityUpdate"]:
         """Get the latest state of the source entities.
 
         Args:
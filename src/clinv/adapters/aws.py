@@ -1,9 +1,12 @@
 """Define the AWS sources used by Clinv."""
 
+import itertools
 import logging
-import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
-from typing import Any, Dict, List, Optional, Type
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 import boto3
 from botocore.client import Config
@@ -15,25 +18,58 @@ from botocore.exceptions import (
 from rich.progress import track
 
 from ..model import RESOURCE_TYPES, aws
-from ..model.entity import EntityAttrs, EntityState, EntityT, EntityUpdate
+from ..model.entity import EntityAttrs, EntityId, EntityState, EntityT, EntityUpdate
 from .abstract import AbstractSource
 
 log = logging.getLogger(__name__)
 
-config = Config(connect_timeout=3, retries={"max_attempts": 0})
+# Maximum number of concurrent AWS API requests done by each resource type updater.
+MAX_WORKERS = 8
+
+# The clients are shared between the updater threads, so the connection pool needs
+# to be able to hold all the concurrent requests.
+config = Config(
+    connect_timeout=3,
+    max_pool_connections=MAX_WORKERS * 2,
+    retries={"max_attempts": 0},
+)
+
+# The requests to the global services are done concurrently for each of their
+# elements, for example the Route53 hosted zones, the S3 buckets or the IAM groups,
+# so AWS may throttle them. Their clients retry those requests, while the regional
+# ones keep failing fast so that an unreachable region doesn't stall the update.
+GLOBAL_SERVICES = frozenset(("iam", "route53", "s3"))
+global_config = config.merge(Config(retries={"max_attempts": 4, "mode": "standard"}))
+
+# The default boto3 session is not thread safe, so the clients can't be created
+# concurrently.
+_client_lock = threading.Lock()
+
+# Resource types whose data is fetched from every AWS region.
+REGIONAL_RESOURCE_TYPES = frozenset(("asg", "ec2", "rds", "sg", "vpc"))
+
+FetchArgument = TypeVar("FetchArgument")
+FetchResult = TypeVar("FetchResult")
+
+# Raw data of the AWS resources, as returned by the API.
+AWSData = List[Dict[str, Any]]
+# Subnet ids of each VPC, indexed by the VPC id.
+SubnetIndex = Dict[str, List[str]]
 
 
 class AWSSource(AbstractSource):
     """Define the interface to interact with the source of AWS entities."""
 
-    @property
+    @cached_property
     def regions(self) -> List[str]:
         """Get the AWS regions.
 
+        The regions rarely change, so they're only fetched once per source.
+
         Returns:
             list: AWS Regions.
         """
-        ec2 = boto3.client("ec2", region_name="us-east-1", config=config)
+        ec2 = _client("ec2", "us-east-1")
         return [region["RegionName"] for region in ec2.describe_regions()["Regions"]]
 
     def update(
@@ -64,7 +100,7 @@ class AWSSource(AbstractSource):
             "vpc": self._update_vpc,
         }
         if resource_types is None:
-            resource_types = list(update_mapper.keys())
+            resource_types = list(update_mapper)
         else:
             # Only process the AWS resources
             resource_types = [
@@ -73,123 +109,138 @@ class AWSSource(AbstractSource):
                 if resource_type in update_mapper
             ]
 
+        # Index the active resources by model and id, so that each resource type
+        # updater only touches its own remaining entities, and finds them directly.
+        remaining_entities: Dict[Any, Dict[EntityId, EntityT]] = {
+            RESOURCE_TYPES[resource_type]: {} for resource_type in resource_types
+        }
+        if active_resources is not None:
+            for entity in active_resources:
+                model_entities = remaining_entities.get(type(entity))
+                if model_entities is not None:
+                    model_entities[entity.id_] = entity
+
+        # The regional updaters share the list of regions. Fetch it before they start,
+        # so that they don't all request it at the same time.
+        if not REGIONAL_RESOURCE_TYPES.isdisjoint(resource_types):
+            regions = self.regions
+            log.debug(f"Fetching the AWS data of {len(regions)} regions")
+
+        # Create entity updates. The resource types are independent from each other,
+        # so their data is fetched concurrently.
         entity_updates = []
-        if active_resources is None:
-            remaining_entities = []
-        else:
-            remaining_entities = active_resources
-
-        # Create entity updates
-        for resource_type in track(resource_types, description="Get AWS data"):
-            with suppress(KeyError):
-                entity_updates += update_mapper[resource_type](remaining_entities)
+        with ThreadPoolExecutor(max_workers=len(update_mapper)) as executor:
+            # ignore: the EntityT of the updaters is not the same as the one of the
+            # update method, even though they are the same type ¯\(°_o)/¯
+            futures = [
+                executor.submit(
+                    update_mapper[resource_type],
+                    remaining_entities[RESOURCE_TYPES[resource_type]],  # type: ignore
+                )
+                for resource_type in resource_types
+            ]
+            for future in track(futures, description="Get AWS data"):
+                entity_updates += future.result()
 
         # Mark entities that were no present in the updates as terminated
-        resource_models = [
-            RESOURCE_TYPES[resource_type] for resource_type in resource_types
-        ]
-        for entity in remaining_entities:
-            if type(entity) in resource_models:
-                log.info(
-                    f"Marking '{entity.model_name}' with id '{entity.id_}' and name "
-                    f"'{entity.name}' as terminated"
-                )
-                entity.state = EntityState.TERMINATED
-                entity_updates.append(
-                    EntityUpdate(model=type(entity), data=entity.dict())
-                )
+        for entity in itertools.chain.from_iterable(
+            model_entities.values() for model_entities in remaining_entities.values()
+        ):
+            log.info(
+                f"Marking '{entity.model_name}' with id '{entity.id_}' and name "
+                f"'{entity.name}' as terminated"
+            )
+            entity.state = EntityState.TERMINATED
+            entity_updates.append(EntityUpdate.from_data(type(entity), entity.dict()))
 
         return entity_updates
 
-    def _update_ec2(self, remaining_entities: List[EntityT]) -> List[EntityUpdate]:
+    def _update_ec2(
+        self, remaining_entities: Dict[EntityId, EntityT]
+    ) -> List[EntityUpdate]:
         """Fetch the data of the EC2 instances.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
         """
         log.info("Updating EC2 instances.")
         entity_updates = []
-        entity_data: EntityAttrs = {}
-
-        for region in self.regions:
-            ec2 = boto3.client("ec2", region_name=region, config=config)
-            region_data = ec2.describe_instances()["Reservations"]
-            for reservation in region_data:
-                for instance in reservation["Instances"]:
-                    entity_data = {
-                        "ami": instance["ImageId"],
-                        "id_": instance["InstanceId"],
-                        "region": region,
-                        "size": instance["InstanceType"],
-                        "start_date": instance["LaunchTime"],
-                        "state": instance["State"]["Name"],
-                    }
-
-                    # Correct the state
-                    if entity_data["state"] == "running":
-                        entity_data["state"] = "active"
-
-                    # Get the instance name and monitor status
-                    with suppress(KeyError):
-                        for tag in instance["Tags"]:
-                            if tag["Key"] == "Name":
-                                entity_data["name"] = tag["Value"]
-                            elif tag["Key"] == "monitor":
-                                entity_data["monitor"] = bool(tag["Value"])
-
-                    # Get the security groups
-                    with suppress(KeyError):
-                        entity_data["security_groups"] = [
-                            security_group["GroupId"]
-                            for security_group in instance["SecurityGroups"]
-                        ]
-
-                    # Get the instance network information
-                    with suppress(KeyError):
-                        entity_data["vpc"] = instance["VpcId"]
-                        entity_data["subnet"] = instance["SubnetId"]
-
-                    # Get the private ips
-                    with suppress(KeyError):
-                        entity_data["private_ips"] = []
-                        for interface in instance["NetworkInterfaces"]:
-                            for address in interface["PrivateIpAddresses"]:
-                                entity_data["private_ips"].append(
-                                    address["PrivateIpAddress"]
-                                )
-
-                    # Get the public ips
-                    with suppress(KeyError):
-                        entity_data["public_ips"] = []
-                        for interface in instance["NetworkInterfaces"]:
-                            for association in interface["PrivateIpAddresses"]:
-                                entity_data["public_ips"].append(
-                                    association["Association"]["PublicIp"]
-                                )
-
-                    # Get the state transition
-                    with suppress(KeyError):
-                        entity_data["state_transition"] = instance[
-                            "StateTransitionReason"
-                        ]
-
-                    # ignore: I don't know why it's not able to infer the type of the
-                    # argument 1 of _build_entity_update ¯\(°_o)/¯
-                    entity_updates.append(
-                        _build_entity_update(  # type: ignore
-                            entity_data, aws.EC2, remaining_entities
-                        )
+
+        regions = self.regions
+        regions_data = _fetch_concurrently(_fetch_ec2_instances, regions)
+
+        for region, region_data in zip(regions, regions_data):
+            for instance in region_data:
+                entity_data: EntityAttrs = {
+                    "ami": instance["ImageId"],
+                    "id_": instance["InstanceId"],
+                    "region": region,
+                    "size": instance["InstanceType"],
+                    "start_date": instance["LaunchTime"],
+                    "state": instance["State"]["Name"],
+                }
+
+                # Correct the state
+                if entity_data["state"] == "running":
+                    entity_data["state"] = "active"
+
+                # Get the instance name and monitor status
+                tags = {tag["Key"]: tag["Value"] for tag in instance.get("Tags", [])}
+                if "Name" in tags:
+                    entity_data["name"] = tags["Name"]
+                if "monitor" in tags:
+                    entity_data["monitor"] = bool(tags["monitor"])
+
+                # Get the security groups
+                entity_data["security_groups"] = [
+                    security_group["GroupId"]
+                    for security_group in instance.get("SecurityGroups", [])
+                ]
+
+                # Get the instance network information
+                if "VpcId" in instance:
+                    entity_data["vpc"] = instance["VpcId"]
+                if "SubnetId" in instance:
+                    entity_data["subnet"] = instance["SubnetId"]
+
+                # Get the private and public ips
+                private_ips = entity_data["private_ips"] = []
+                public_ips = entity_data["public_ips"] = []
+                for interface in instance.get("NetworkInterfaces", []):
+                    for address in interface["PrivateIpAddresses"]:
+                        private_ips.append(address["PrivateIpAddress"])
+                        # Associations like the Wavelength carrier ips don't have
+                        # a public ip.
+                        association = address.get("Association")
+                        public_ip = association.get("PublicIp") if association else None
+                        if public_ip is not None:
+                            public_ips.append(public_ip)
+
+                # Get the state transition
+                if "StateTransitionReason" in instance:
+                    entity_data["state_transition"] = instance["StateTransitionReason"]
+
+                # ignore: I don't know why it's not able to infer the type of the
+                # argument 1 of _build_entity_update ¯\(°_o)/¯
+                entity_updates.append(
+                    _build_entity_update(  # type: ignore
+                        entity_data, aws.EC2, remaining_entities
                     )
+                )
         return entity_updates
 
-    def _update_rds(self, remaining_entities: List[EntityT]) -> List[EntityUpdate]:
+    def _update_rds(
+        self, remaining_entities: Dict[EntityId, EntityT]
+    ) -> List[EntityUpdate]:
         """Fetch the data of the RDS instances.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
@@ -197,12 +248,10 @@ class AWSSource(AbstractSource):
         log.info("Updating RDS instances.")
         entity_updates = []
 
-        for region in self.regions:
-            rds = boto3.client("rds", region_name=region, config=config)
-            try:
-                region_data = rds.describe_db_instances()["DBInstances"]
-            except (ClientError, ConnectTimeoutError, EndpointConnectionError):
-                log.debug(f"Error fetching the RDS info from {region}")
+        regions = self.regions
+        regions_data = _fetch_concurrently(_fetch_rds_instances, regions)
+
+        for region, region_data in zip(regions, regions_data):
             for instance in region_data:
                 endpoint = (
                     f"{instance['Endpoint']['Address']}:{instance['Endpoint']['Port']}"
@@ -222,28 +271,26 @@ class AWSSource(AbstractSource):
                 }
 
                 # Get the instance name
-                with suppress(KeyError):
+                if "DBInstanceIdentifier" in instance:
                     entity_data["name"] = instance["DBInstanceIdentifier"]
 
                 # Get the instance state
-                with suppress(KeyError):
-                    state = instance["DBInstanceStatus"]
-                    if state == "available":
-                        state = "active"
+                state = instance.get("DBInstanceStatus")
+                if state == "available":
+                    entity_data["state"] = "active"
+                elif state is not None:
                     entity_data["state"] = state
 
                 # Get the security groups
-                with suppress(KeyError):
-                    entity_data["security_groups"] = [
-                        security_group["VpcSecurityGroupId"]
-                        for security_group in instance["VpcSecurityGroups"]
-                    ]
+                entity_data["security_groups"] = [
+                    security_group["VpcSecurityGroupId"]
+                    for security_group in instance.get("VpcSecurityGroups", [])
+                ]
 
                 # Get the monitor status
-                with suppress(KeyError):
-                    for tag in instance["TagList"]:
-                        if tag["Key"] == "monitor":
-                            entity_data["monitor"] = bool(tag["Value"])
+                tags = {tag["Key"]: tag["Value"] for tag in instance.get("TagList", [])}
+                if "monitor" in tags:
+                    entity_data["monitor"] = bool(tags["monitor"])
 
                 # ignore: I don't know why it's not able to infer the type of the
                 # argument 1 of _build_entity_update ¯\(°_o)/¯
@@ -255,11 +302,14 @@ class AWSSource(AbstractSource):
         return entity_updates
 
     @classmethod
-    def _update_s3(cls, remaining_entities: List[EntityT]) -> List[EntityUpdate]:
+    def _update_s3(
+        cls, remaining_entities: Dict[EntityId, EntityT]
+    ) -> List[EntityUpdate]:
         """Fetch the data of the S3 buckets.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
@@ -269,10 +319,15 @@ class AWSSource(AbstractSource):
         entity_updates = []
 
         # Create S3 client, describe buckets.
-        s3_client = boto3.client("s3", config=config)
+        s3_client = _client("s3")
         buckets = s3_client.list_buckets()["Buckets"]
 
-        for instance in buckets:
+        buckets_grants = _fetch_concurrently(
+            lambda bucket: s3_client.get_bucket_acl(Bucket=bucket["Name"])["Grants"],
+            buckets,
+        )
+
+        for instance, grants in zip(buckets, buckets_grants):
             entity_data = {
                 "id_": f"s3-{instance['Name']}",
                 "name": instance["Name"],
@@ -283,24 +338,23 @@ class AWSSource(AbstractSource):
             }
 
             # Check if there is any public access to the bucket
-            for grant in s3_client.get_bucket_acl(Bucket=instance["Name"])["Grants"]:
-                with suppress(KeyError):
-                    if (
-                        grant["Grantee"]["URI"]
-                        == "http://acs.amazonaws.com/groups/global/AllUsers"
-                    ):
-                        permissions = grant["Permission"]
-                        if isinstance(permissions, str):
-                            permissions = [permissions]
-                        for permission in permissions:
-                            if permission == "READ":
-                                entity_data["public_read"] = True
-                            elif permission == "WRITE":
-                                entity_data["public_write"] = True
-                            elif permission == "READ_ACP":
-                                entity_data["public_read"] = False
-                            elif permission == "WRITE_ACP":
-                                entity_data["public_write"] = False
+            for grant in grants:
+                if (
+                    grant["Grantee"].get("URI")
+                    == "http://acs.amazonaws.com/groups/global/AllUsers"
+                ):
+                    permissions = grant["Permission"]
+                    if isinstance(permissions, str):
+                        permissions = [permissions]
+                    for permission in permissions:
+                        if permission == "READ":
+                            entity_data["public_read"] = True
+                        elif permission == "WRITE":
+                            entity_data["public_write"] = True
+                        elif permission == "READ_ACP":
+                            entity_data["public_read"] = False
+                        elif permission == "WRITE_ACP":
+                            entity_data["public_write"] = False
 
             # ignore: I don't know why it's not able to infer the type of the
             # argument 1 of _build_entity_update ¯\(°_o)/¯
@@ -313,11 +367,14 @@ class AWSSource(AbstractSource):
         return entity_updates
 
     @classmethod
-    def _update_route53(cls, remaining_entities: List[EntityT]) -> List[EntityUpdate]:
+    def _update_route53(
+        cls, remaining_entities: Dict[EntityId, EntityT]
+    ) -> List[EntityUpdate]:
         """Fetch the data of the Route53 records.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
@@ -326,29 +383,20 @@ class AWSSource(AbstractSource):
 
         entity_updates = []
 
-        route53 = boto3.client("route53", config=config)
-        hosted_zones = route53.list_hosted_zones()["HostedZones"]
+        route53 = _client("route53")
+        hosted_zones = _paginate(route53, "list_hosted_zones", "HostedZones")
 
-        for hosted_zone in hosted_zones:
-            records = route53.list_resource_record_sets(
-                HostedZoneId=hosted_zone["Id"],
-            )
-
-            instances = records["ResourceRecordSets"]
-
-            # We can't test it until https://github.com/spulec/moto/issues/3879 is
-            # solved. The test is done but it's skipped
-            while records["IsTruncated"]:
-                records = route53.list_resource_record_sets(
-                    HostedZoneId=hosted_zone["Id"],
-                    StartRecordName=records["NextRecordName"],
-                    StartRecordType=records["NextRecordType"],
-                )
-                instances += records["ResourceRecordSets"]
+        hosted_zones_records = _fetch_concurrently(
+            lambda hosted_zone: _fetch_route53_records(route53, hosted_zone["Id"]),
+            hosted_zones,
+        )
 
+        for hosted_zone, instances in zip(hosted_zones, hosted_zones_records):
+            hosted_zone_id = hosted_zone["Id"].replace("/hostedzone/", "")
             for instance in instances:
-                hosted_zone_id = re.sub(r"/hostedzone/", "", hosted_zone["Id"])
-                name = re.sub(r"\.$", "", instance["Name"])
+                name = instance["Name"]
+                if name.endswith("."):
+                    name = name[:-1]
                 entity_data = {
                     "id_": f"{hosted_zone_id}-{name}-{instance['Type'].lower()}",
                     "hosted_zone": hosted_zone_id,
@@ -374,11 +422,14 @@ class AWSSource(AbstractSource):
                 )
         return entity_updates
 
-    def _update_vpc(self, remaining_entities: List[EntityT]) -> List[EntityUpdate]:
+    def _update_vpc(
+        self, remaining_entities: Dict[EntityId, EntityT]
+    ) -> List[EntityUpdate]:
         """Fetch the data of the VPC resources.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
@@ -387,9 +438,11 @@ class AWSSource(AbstractSource):
 
         entity_updates = []
 
-        for region in self.regions:
-            ec2 = boto3.client("ec2", region_name=region, config=config)
-            for instance in ec2.describe_vpcs()["Vpcs"]:
+        regions = self.regions
+        regions_data = _fetch_concurrently(_fetch_vpcs, regions)
+
+        for region, (region_data, region_subnets) in zip(regions, regions_data):
+            for instance in region_data:
                 entity_data = {
                     "id_": instance["VpcId"],
                     "region": region,
@@ -398,23 +451,11 @@ class AWSSource(AbstractSource):
                 }
 
                 # Get the instance name
-                with suppress(KeyError):
-                    for tag in instance["Tags"]:
-                        if tag["Key"] == "Name":
-                            entity_data["name"] = tag["Value"]
-
-                # Get the subnets
-                subnets = ec2.describe_subnets(
-                    Filters=[
-                        {
-                            "Name": "vpc-id",
-                            "Values": [
-                                entity_data["id_"],
-                            ],
-                        },
-                    ],
-                )["Subnets"]
-                entity_data["subnets"] = [subnet["SubnetId"] for subnet in subnets]
+                tags = {tag["Key"]: tag["Value"] for tag in instance.get("Tags", [])}
+                if "Name" in tags:
+                    entity_data["name"] = tags["Name"]
+
+                entity_data["subnets"] = region_subnets[instance["VpcId"]]
 
                 # ignore: I don't know why it's not able to infer the type of the
                 # argument 1 of _build_entity_update ¯\(°_o)/¯
@@ -425,11 +466,14 @@ class AWSSource(AbstractSource):
                 )
         return entity_updates
 
-    def _update_asg(self, remaining_entities: List[EntityT]) -> List[EntityUpdate]:
+    def _update_asg(
+        self, remaining_entities: Dict[EntityId, EntityT]
+    ) -> List[EntityUpdate]:
         """Fetch the data of the ASG resources.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
@@ -438,15 +482,11 @@ class AWSSource(AbstractSource):
 
         entity_updates = []
 
-        for region in self.regions:
-            autoscaling = boto3.client("autoscaling", region_name=region, config=config)
-            try:
-                instances = autoscaling.describe_auto_scaling_groups()[
-                    "AutoScalingGroups"
-                ]
-            except (ClientError, ConnectTimeoutError, EndpointConnectionError):
-                log.debug(f"Error fetching the ASG info from {region}")
-            for instance in instances:
+        regions = self.regions
+        regions_data = _fetch_concurrently(_fetch_auto_scaling_groups, regions)
+
+        for region, region_data in zip(regions, regions_data):
+            for instance in region_data:
                 entity_data = {
                     "id_": f"asg-{instance['AutoScalingGroupName']}",
                     "name": instance["AutoScalingGroupName"],
@@ -463,18 +503,19 @@ class AWSSource(AbstractSource):
                     ],
                 }
 
-                # Get the instance name
-                with suppress(KeyError):
+                # Get the launch configuration
+                if "LaunchConfigurationName" in instance:
                     entity_data["launch_configuration"] = instance[
                         "LaunchConfigurationName"
                     ]
 
                 # Won't test it until they are supported by moto
                 # https://github.com/spulec/moto/issues/2003
-                with suppress(KeyError):
+                launch_template = instance.get("LaunchTemplate")
+                if launch_template is not None:
                     entity_data["launch_template"] = (
-                        f'{instance["LaunchTemplate"]["LaunchTemplateName"][:35]}'
-                        f':{instance["LaunchTemplate"]["Version"]}'
+                        f'{launch_template["LaunchTemplateName"][:35]}'
+                        f':{launch_template["Version"]}'
                     )
 
                 # ignore: I don't know why it's not able to infer the type of the
@@ -487,11 +528,14 @@ class AWSSource(AbstractSource):
 
         return entity_updates
 
-    def _update_sg(self, remaining_entities: List[EntityT]) -> List[EntityUpdate]:
+    def _update_sg(
+        self, remaining_entities: Dict[EntityId, EntityT]
+    ) -> List[EntityUpdate]:
         """Fetch the data of the Security Group resources.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
@@ -500,29 +544,26 @@ class AWSSource(AbstractSource):
 
         entity_updates = []
 
-        for region in self.regions:
-            ec2 = boto3.client("ec2", region_name=region, config=config)
-            instances = ec2.describe_security_groups()["SecurityGroups"]
-            for instance in instances:
+        regions = self.regions
+        regions_data = _fetch_concurrently(_fetch_security_groups, regions)
+
+        for region, region_data in zip(regions, regions_data):
+            for instance in region_data:
                 entity_data = {
                     "id_": instance["GroupId"],
                     "name": instance["GroupName"],
                     "description": instance["Description"],
                     "region": region,
                     "state": "active",
-                    "egress": [],
-                    "ingress": [],
-                }
-
-                for egress_rule in instance["IpPermissionsEgress"]:
-                    entity_data["egress"].append(
+                    "egress": [
                         build_security_group_rule_data(egress_rule)
-                    )
-
-                for ingress_rule in instance["IpPermissions"]:
-                    entity_data["ingress"].append(
+                        for egress_rule in instance["IpPermissionsEgress"]
+                    ],
+                    "ingress": [
                         build_security_group_rule_data(ingress_rule)
-                    )
+                        for ingress_rule in instance["IpPermissions"]
+                    ],
+                }
 
                 # ignore: I don't know why it's not able to infer the type of the
                 # argument 1 of _build_entity_update ¯\(°_o)/¯
@@ -534,11 +575,14 @@ class AWSSource(AbstractSource):
         return entity_updates
 
     @classmethod
-    def _update_iam_users(cls, remaining_entities: List[EntityT]) -> List[EntityUpdate]:
+    def _update_iam_users(
+        cls, remaining_entities: Dict[EntityId, EntityT]
+    ) -> List[EntityUpdate]:
         """Fetch the data of the IAM users.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
@@ -547,9 +591,9 @@ class AWSSource(AbstractSource):
 
         entity_updates = []
 
-        iam = boto3.client("iam", config=config)
+        iam = _client("iam")
 
-        user_instances = iam.list_users()["Users"]
+        user_instances = _paginate(iam, "list_users", "Users")
         for instance in user_instances:
             entity_data = {
                 "id_": f'iamu-{instance["UserName"].lower()}',
@@ -569,12 +613,13 @@ class AWSSource(AbstractSource):
 
     @classmethod
     def _update_iam_groups(
-        cls, remaining_entities: List[EntityT]
+        cls, remaining_entities: Dict[EntityId, EntityT]
     ) -> List[EntityUpdate]:
         """Fetch the data of the IAM groups.
 
         Args:
-            remaining_entities: entities that haven't yet been processed by the update
+            remaining_entities: entities that haven't yet been processed by the update,
+                indexed by their id.
 
         Returns:
             List of entity updates.
@@ -583,12 +628,18 @@ class AWSSource(AbstractSource):
 
         entity_updates = []
 
-        iam = boto3.client("iam", config=config)
+        iam = _client("iam")
+
+        group_instances = _paginate(iam, "list_groups", "Groups")
+        groups_users = _fetch_concurrently(
+            lambda group: _paginate(
+                iam, "get_group", "Users", GroupName=group["GroupName"]
+            ),
+            group_instances,
+        )
 
-        group_instances = iam.list_groups()["Groups"]
-        for instance in group_instances:
-            group_data = iam.get_group(GroupName=instance["GroupName"])
-            users = [f'iamu-{user["UserName"].lower()}' for user in group_data["Users"]]
+        for instance, group_users in zip(group_instances, groups_users):
+            users = [f'iamu-{user["UserName"].lower()}' for user in group_users]
             entity_data: EntityAttrs = {
                 "id_": f'iamg-{instance["GroupName"].lower()}',
                 "name": instance["GroupName"],
@@ -656,20 +707,199 @@ def build_security_group_rule_data(rule_data: Dict[str, Any]) -> Dict[str, Any]:
 def _build_entity_update(
     entity_data: EntityAttrs,
     entity_model: Type[EntityT],
-    remaining_entities: List[EntityT],
+    remaining_entities: Dict[EntityId, EntityT],
 ) -> EntityUpdate:
     """Create the EntityUpdate object from the entity_data and model.
 
-    Also remove the entity identified by the data from the list of remaining entities.
+    Also remove the entity identified by the data from the remaining entities.
 
     """
-    # Remove entity from remaining_entities
-    for entity in remaining_entities:
-        if isinstance(entity, entity_model) and entity.id_ == entity_data["id_"]:
-            remaining_entities.remove(entity)
-            saved_entity_data = entity.dict()
-            break
+    entity = remaining_entities.pop(entity_data["id_"], None)
+    if entity is None:
+        data = entity_data
     else:
-        saved_entity_data = {}
+        # Keep the saved attributes that are not managed by the source.
+        data = entity.dict()
+        data.update(entity_data)
+
+    return EntityUpdate.from_data(entity_model, data)
+
+
+def _fetch_concurrently(
+    fetch: Callable[[FetchArgument], FetchResult], arguments: List[FetchArgument]
+) -> List[FetchResult]:
+    """Call the fetch function for each argument concurrently.
+
+    The AWS API calls are I/O bound, so using threads we wait for the slowest
+    request instead of the sum of all of them.
+
+    Args:
+        fetch: Function that retrieves the data of one argument.
+        arguments: Elements to fetch, for example the AWS regions.
+
+    Returns:
+        List of the results of the fetch function, in the same order as the arguments.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(fetch, arguments))
+
+
+def _fetch_ec2_instances(region: str) -> List[Dict[str, Any]]:
+    """Fetch the raw data of the EC2 instances of a region.
+
+    Args:
+        region: AWS region to query.
+
+    Returns:
+        List of EC2 instances.
+    """
+    reservations = _paginate(
+        _client("ec2", region), "describe_instances", "Reservations"
+    )
+    return [
+        instance
+        for reservation in reservations
+        for instance in reservation["Instances"]
+    ]
+
+
+def _fetch_vpcs(region: str) -> Tuple[AWSData, SubnetIndex]:
+    """Fetch the raw data of the VPCs of a region and the ids of their subnets.
+
+    Args:
+        region: AWS region to query.
+
+    Returns:
+        List of VPCs, and the subnet ids of each VPC indexed by the VPC id.
+    """
+    ec2 = _client("ec2", region)
+    vpcs = _paginate(ec2, "describe_vpcs", "Vpcs")
+
+    # Fetch all the subnets of the region at once instead of once per VPC.
+    subnets: SubnetIndex = {vpc["VpcId"]: [] for vpc in vpcs}
+    for subnet in _paginate(ec2, "describe_subnets", "Subnets"):
+        subnets.setdefault(subnet["VpcId"], []).append(subnet["SubnetId"])
+
+    return vpcs, subnets
+
+
+def _fetch_auto_scaling_groups(region: str) -> List[Dict[str, Any]]:
+    """Fetch the raw data of the Auto Scaling Groups of a region.
+
+    Args:
+        region: AWS region to query.
+
+    Returns:
+        List of Auto Scaling Groups, or an empty list if the region can't be queried.
+    """
+    autoscaling = _client("autoscaling", region)
+    try:
+        return _paginate(
+            autoscaling, "describe_auto_scaling_groups", "AutoScalingGroups"
+        )
+    except (ClientError, ConnectTimeoutError, EndpointConnectionError):
+        log.debug(f"Error fetching the ASG info from {region}")
+        return []
+
+
+def _fetch_security_groups(region: str) -> List[Dict[str, Any]]:
+    """Fetch the raw data of the Security Groups of a region.
+
+    Args:
+        region: AWS region to query.
+
+    Returns:
+        List of Security Groups.
+    """
+    return _paginate(
+        _client("ec2", region), "describe_security_groups", "SecurityGroups"
+    )
+
+
+def _fetch_rds_instances(region: str) -> List[Dict[str, Any]]:
+    """Fetch the raw data of the RDS instances of a region.
+
+    Args:
+        region: AWS region to query.
+
+    Returns:
+        List of RDS instances, or an empty list if the region can't be queried.
+    """
+    try:
+        return _paginate(
+            _client("rds", region),
+            "describe_db_instances",
+            "DBInstances",
+            PaginationConfig={"PageSize": 100},
+        )
+    except (ClientError, ConnectTimeoutError, EndpointConnectionError):
+        log.debug(f"Error fetching the RDS info from {region}")
+        return []
+
+
+# ANN401: Any is not allowed, but the boto3 clients don't have types.
+def _fetch_route53_records(
+    route53: Any, hosted_zone_id: str  # noqa: ANN401
+) -> List[Dict[str, Any]]:
+    """Fetch the raw data of all the records of a Route53 hosted zone.
+
+    Args:
+        route53: boto3 Route53 client.
+        hosted_zone_id: Id of the hosted zone to query.
+
+    Returns:
+        List of Route53 records.
+    """
+    return _paginate(
+        route53,
+        "list_resource_record_sets",
+        "ResourceRecordSets",
+        HostedZoneId=hosted_zone_id,
+        PaginationConfig={"PageSize": 300},
+    )
+
+
+# ANN401: Any is not allowed, but the boto3 clients and the arguments of the API
+# calls don't have types.
+def _paginate(
+    client: Any, operation: str, key: str, **kwargs: Any  # noqa: ANN401
+) -> List[Dict[str, Any]]:
+    """Fetch all the elements of a paginated AWS API call.
+
+    Args:
+        client: boto3 client of the service.
+        operation: Name of the paginated client method, for example `describe_vpcs`.
+        key: Key of the response pages that holds the elements.
+        kwargs: Arguments of the API call.
+
+    Returns:
+        List of the elements of all the pages.
+    """
+    paginator = client.get_paginator(operation)
+    return [element for page in paginator.paginate(**kwargs) for element in page[key]]
 
-    return EntityUpdate(model=entity_model, data={**saved_entity_data, **entity_data})
+
+# ANN401: Any is not allowed, but the boto3 clients don't have types.
+@lru_cache(maxsize=None)
+def _client(  # noqa: ANN401
+    service_name: str, region_name: Optional[str] = None
+) -> Any:
+    """Create a boto3 client that can be used safely from several threads.
+
+    Building a client means loading the service model and the endpoint data, which
+    is expensive compared to the API call itself, so the clients are reused for each
+    service and region.
+
+    Args:
+        service_name: AWS service to connect to, for example `ec2`.
+        region_name: AWS region to connect to.
+
+    Returns:
+        boto3 client of the service.
+    """
+    if service_name in GLOBAL_SERVICES:
+        client_config = global_config
+    else:
+        client_config = config
+    with _client_lock:
+        return boto3.client(service_name, region_name=region_name, config=client_config)
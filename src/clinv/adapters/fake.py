@@ -37,6 +37,6 @@ class FakeSource(AbstractSource):
     def add_change(self, entity: EntityT, entity_data: Dict[str, Any]) -> None:
         """Record changes on entities to be returned when calling the update method."""
         entity_data["id_"] = entity.id_
-        self._entity_updates.append(
-            EntityUpdate(data={**entity.dict(), **entity_data}, model=type(entity))
-        )
+        data = entity.dict()
+        data.update(entity_data)
+        self._entity_updates.append(EntityUpdate.from_data(type(entity), data))
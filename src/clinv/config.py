@@ -6,6 +6,9 @@ from typing import List
 
 from goodconf import GoodConf
 
+# Directory where clinv stores its configuration and data.
+DATA_DIRECTORY = os.path.expanduser("~/.local/share/clinv")
+
 
 class LogLevel(str, Enum):
     """Define the possible log levels."""
@@ -20,7 +23,7 @@ class Config(GoodConf):
     """Define the configuration of the program."""
 
     log_level: LogLevel = LogLevel.INFO
-    database_url: str = "tinydb://~/.local/share/clinv/database.tinydb"
+    database_url: str = f"tinydb://{DATA_DIRECTORY}/database.tinydb"
 
     # Where should clinv search for entities for the inventory.
     sources: List[str] = ["aws", "risk"]
@@ -42,6 +45,6 @@ class Config(GoodConf):
 
         env_previx = "CLINV_"
         default_files = [
-            os.path.expanduser("~/.local/share/clinv/config.yaml"),
+            os.path.join(DATA_DIRECTORY, "config.yaml"),
             "config.yaml",
         ]
@@ -6,11 +6,10 @@ Functions:
 
 import logging
 import os
-from typing import List
+import sys
+from typing import List, Optional
 
-from rich.logging import RichHandler
-
-from ..adapters import AVAILABLE_SOURCES, AdapterSource
+from ..adapters import AdapterSource, get_source
 from ..config import Config
 
 log = logging.getLogger(__name__)
@@ -23,23 +22,34 @@ def load_logger(verbose: bool = False) -> None:  # pragma: no cover
     Args:
         verbose: Set the logging level to Debug.
     """
-    if verbose:
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="  %(message)s (%(name)s)",
-            datefmt="[%X]",
-            handlers=[RichHandler(rich_tracebacks=True)],
+    # rich takes long to import and its formatting is only useful when a person is
+    # reading the output, so unattended runs like cron jobs use a plain handler.
+    handler: logging.Handler
+    if sys.stdout.isatty():
+        from rich.logging import RichHandler  # noqa: C0415
+
+        handler = RichHandler(rich_tracebacks=True)
+        handler.setFormatter(
+            logging.Formatter(
+                "  %(message)s" + (" (%(name)s)" if verbose else ""), datefmt="[%X]"
+            )
         )
     else:
-        logging.basicConfig(
-            level=logging.INFO,
-            format="  %(message)s",
-            datefmt="[%X]",
-            handlers=[RichHandler(rich_tracebacks=True)],
+        # RichHandler prints the time and level columns by itself, the plain handler
+        # needs them in its format.
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s %(levelname)s %(message)s"
+                + (" (%(name)s)" if verbose else "")
+            )
         )
-    logging.getLogger("boto3").setLevel(logging.WARNING)
-    logging.getLogger("botocore").setLevel(logging.WARNING)
-    logging.getLogger("goodconf").setLevel(logging.WARNING)
+
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.INFO, handlers=[handler]
+    )
+    for logger_name in ("boto3", "botocore", "goodconf", "s3transfer", "urllib3"):
+        logging.getLogger(logger_name).setLevel(logging.WARNING)
 
 
 def load_config(config_path: str) -> Config:
@@ -50,9 +60,33 @@ def load_config(config_path: str) -> Config:
     except FileNotFoundError:
         config.load()
 
+    # Create the directory of the database the first time it's used
+    database_directory = _get_database_directory(config.database_url)
+    if database_directory is not None:
+        os.makedirs(database_directory, exist_ok=True)
+
     return config
 
 
+def _get_database_directory(database_url: str) -> Optional[str]:
+    """Get the directory of a TinyDB database.
+
+    The path is extracted from the url the same way repository_orm's
+    TinyDBRepository does.
+
+    Args:
+        database_url: Url used to connect to the database.
+
+    Returns:
+        The directory of the database file, or None if the database is not a TinyDB
+        one or its file is in the working directory.
+    """
+    if not database_url.startswith("tinydb://"):
+        return None
+    database_file = os.path.expanduser(database_url.replace("tinydb://", ""))
+    return os.path.dirname(database_file) or None
+
+
 def load_adapters(config: "Config") -> List[AdapterSource]:
     """Configure the source adapters.
 
@@ -62,10 +96,5 @@ def load_adapters(config: "Config") -> List[AdapterSource]:
     Returns:
         List of configured sources adapters to work with.
     """
-    sources: List[AdapterSource] = []
     log.debug("Initializing the adapters")
-    for source_name in config.sources:
-        # ignore. AdapterSource is not callable. I still don't know how to fix this.
-        sources.append(AVAILABLE_SOURCES[source_name]())  # type: ignore
-
-    return sources
+    return [get_source(source_name)() for source_name in config.sources]
@@ -1,6 +1,7 @@
 """Command line interface definition."""
 
 import logging
+import os
 import sys
 from contextlib import suppress
 from typing import List, Optional
@@ -8,26 +9,25 @@ from typing import List, Optional
 import click
 from click.core import Context
 from repository_orm import EntityNotFoundError, load_repository
-from rich import box
-from rich.live import Live
-from rich.table import Table
 
-from .. import services, views
+from ..config import DATA_DIRECTORY
 from ..model import MODELS, RESOURCE_NAMES, RESOURCE_TYPES
 from ..model.entity import EntityState
 from ..version import version_info
 from . import load_adapters, load_config, load_logger
-from .tui import PydanticQuestions
 
 log = logging.getLogger(__name__)
 
+# Shared by all the commands that accept a list of resource types.
+RESOURCE_CHOICE = click.Choice(RESOURCE_NAMES)
+
 
 @click.group()
 @click.version_option(version="", message=version_info())
 @click.option(
     "-c",
     "--config_path",
-    default="~/.local/share/clinv/config.yaml",
+    default=os.path.join(DATA_DIRECTORY, "config.yaml"),
     help="configuration file path",
     envvar="CLINV_CONFIG_PATH",
 )
@@ -40,20 +40,25 @@ def cli(ctx: Context, config_path: str, verbose: bool) -> None:
     config = load_config(config_path)
     ctx.obj["config"] = config
     ctx.obj["repo"] = load_repository(config.database_url)
-    ctx.obj["adapters"] = load_adapters(config)
-    ctx.obj["prompter"] = PydanticQuestions()
 
 
 @cli.command()
 @click.pass_context
 @click.argument(
     "resource_types",
-    type=click.Choice(RESOURCE_NAMES),
+    type=RESOURCE_CHOICE,
     required=False,
     nargs=-1,
 )
 def update(ctx: Context, resource_types: List[str]) -> None:
     """Sync the inventory state with the resource providers."""
+    # The services, views and rich modules take long to import, so each command
+    # imports the ones it uses, and `clinv --help` doesn't pay for them.
+    from .. import services  # noqa: C0415
+
+    # Only this command needs the adapters, and some of them, like the AWS one, take
+    # long to import.
+    ctx.obj["adapters"] = load_adapters(ctx.obj["config"])
     if len(resource_types) == 0:
         resource_types = RESOURCE_NAMES
 
@@ -65,6 +70,8 @@ def update(ctx: Context, resource_types: List[str]) -> None:
 @click.argument("resource_id", type=str)
 def print_(ctx: Context, resource_id: str) -> None:
     """Print the information of the resource."""
+    from .. import views  # noqa: C0415
+
     repo = ctx.obj["repo"]
 
     for model in MODELS:
@@ -86,15 +93,15 @@ def print_(ctx: Context, resource_id: str) -> None:
 
 @cli.command(name="list")
 @click.pass_context
-@click.argument(
-    "resource_types", type=click.Choice(RESOURCE_NAMES), required=False, nargs=-1
-)
+@click.argument("resource_types", type=RESOURCE_CHOICE, required=False, nargs=-1)
 @click.option("-a", "--all", "all_", is_flag=True)
 @click.option("-i", "--inactive", is_flag=True)
 def list_(
     ctx: Context, all_: bool, inactive: bool, resource_types: Optional[List[str]] = None
 ) -> None:
     """List the resources in the repository."""
+    from .. import services, views  # noqa: C0415
+
     try:
         entities = services.list_entities(
             ctx.obj["repo"], resource_types, all_=all_, inactive=inactive
@@ -111,9 +118,7 @@ def list_(
 @cli.command(name="search")
 @click.pass_context
 @click.argument("regexp", type=str)
-@click.argument(
-    "resource_types", type=click.Choice(RESOURCE_NAMES), required=False, nargs=-1
-)
+@click.argument("resource_types", type=RESOURCE_CHOICE, required=False, nargs=-1)
 @click.option("-a", "--all", "all_", is_flag=True)
 @click.option("-i", "--inactive", is_flag=True)
 def search(
@@ -124,6 +129,12 @@ def search(
     resource_types: Optional[List[str]] = None,
 ) -> None:
     """Search resources whose attribute match the regular expression."""
+    from rich import box  # noqa: C0415
+    from rich.live import Live  # noqa: C0415
+    from rich.table import Table  # noqa: C0415
+
+    from .. import services, views  # noqa: C0415
+
     # Build table
     table = Table(box=box.MINIMAL_HEAVY_HEAD)
     table.add_column("ID", justify="left", style="green")
@@ -151,14 +162,14 @@ def search(
 
 @cli.command(name="unused")
 @click.pass_context
-@click.argument(
-    "resource_types", type=click.Choice(RESOURCE_NAMES), required=False, nargs=-1
-)
+@click.argument("resource_types", type=RESOURCE_CHOICE, required=False, nargs=-1)
 def unused(
     ctx: Context,
     resource_types: Optional[List[str]] = None,
 ) -> None:
     """Search resources that don't belong to a Service or Project."""
+    from .. import services, views  # noqa: C0415
+
     entities = services.unused(ctx.obj["repo"], resource_types)
     ctx.obj["repo"].close()
 
@@ -173,7 +184,12 @@ def unused(
 )
 def add(ctx: Context, resource_type: str) -> None:
     """Add resources."""
-    prompter = ctx.obj["prompter"]
+    from .. import services, views  # noqa: C0415
+
+    # The prompt libraries are slow to import and only this command needs them.
+    from .tui import PydanticQuestions  # noqa: C0415
+
+    prompter = PydanticQuestions()
     repo = ctx.obj["repo"]
     config = ctx.obj["config"]
 
@@ -197,6 +213,8 @@ def risk(
     ctx: Context,
 ) -> None:
     """Show an ordered list of services by the security value."""
+    from .. import services, views  # noqa: C0415
+
     services_ = services.service_risk(ctx.obj["repo"])
     accesses = services.accesses(ctx.obj["repo"])
     ctx.obj["repo"].close()
@@ -2,7 +2,6 @@
 
 import abc
 import logging
-import re
 from typing import Any, Dict, Optional, Type
 
 from prompt_toolkit.completion import FuzzyWordCompleter
@@ -14,6 +13,19 @@ from ..model.entity import Entity, EntityAttrs
 
 log = logging.getLogger(__name__)
 
+PROMPT_STYLE = Style(
+    [
+        ("separator", "bg:#002b36 fg:#cc5454"),
+        ("qmark", "bg:#002b36  fg:#673ab7 bold"),
+        ("question", "bg:#002b36 fg:#657b83"),
+        ("selected", "fg:#657b83 bg:#002b36"),
+        ("pointer", "fg:#673ab7 bold"),
+        ("highlighted", "fg:#673ab7 bold"),
+        ("answer", "bg:#002b36 #657b83"),
+        ("text", "bg:#002b36 fg:#657b83"),
+    ]
+)
+
 
 class Prompter(abc.ABC):
     """Define the prompter interface."""
@@ -62,58 +74,66 @@ class PydanticQuestions(Prompter):
             choices = {}
 
         schema = model.schema()
-
-        for attribute in schema["tui_fields"]:
+        attributes = schema["tui_fields"]
+
+        while True:
+            for attribute in attributes:
+                default = entity_data.get(attribute)
+                attribute_schema = self._get_attribute_schema(schema, attribute)
+                attribute_type = attribute_schema["type"]
+                attribute_title = attribute_schema["title"]
+
+                if attribute_type == "string":
+                    question_text = f"{attribute_title}: "
+                    entity_data[attribute] = self._ask_choice(
+                        question_text, attribute, choices, default
+                    )
+                elif attribute_type == "integer":
+                    question_text = f"{attribute_title}: "
+                    entity_data[attribute] = int(
+                        self._ask_choice(question_text, attribute, choices, default)
+                    )
+                elif attribute_type == "boolean":
+                    entity_data[attribute] = confirm(
+                        f"{attribute_title}: "
+                    ).unsafe_ask()
+                elif attribute_type == "array":
+                    question_text = f"{attribute_title} (Enter to continue): "
+                    entity_data[attribute] = []
+                    while True:
+                        choice = self._ask_choice(question_text, attribute, choices)
+                        if choice == "":
+                            break
+                        entity_data[attribute].append(choice)
             try:
-                default = entity_data[attribute]
-            except KeyError:
-                default = None
-            attribute_schema = self._get_attribute_schema(schema, attribute)
-            attribute_type = attribute_schema["type"]
-            attribute_title = attribute_schema["title"]
-
-            if attribute_type == "string":
-                question_text = f"{attribute_title}: "
-                entity_data[attribute] = self._ask_choice(
-                    question_text, attribute, choices, default
-                )
-            elif attribute_type == "integer":
-                question_text = f"{attribute_title}: "
-                entity_data[attribute] = int(
-                    self._ask_choice(question_text, attribute, choices, default)
-                )
-            elif attribute_type == "boolean":
-                entity_data[attribute] = confirm(f"{attribute_title}: ").unsafe_ask()
-            elif attribute_type == "array":
-                question_text = f"{attribute_title} (Enter to continue): "
-                entity_data[attribute] = []
-                while True:
-                    choice = self._ask_choice(question_text, attribute, choices)
-                    if choice == "":
-                        break
-                    entity_data[attribute].append(choice)
-        try:
-            return model(**entity_data)
-        except ValidationError as error:
-            log.warning("Error filling up the model")
-            print(error)
-            return self.fill(model=model, entity_data=entity_data, choices=choices)
+                return model(**entity_data)
+            except ValidationError as error:
+                log.warning("Error filling up the model")
+                print(error)
+                # Ask again only for the attributes that failed the validation, or
+                # for all of them if the error isn't tied to one of them.
+                invalid_attributes = {err["loc"][0] for err in error.errors()}
+                attributes = [
+                    attribute
+                    for attribute in schema["tui_fields"]
+                    if attribute in invalid_attributes
+                ] or schema["tui_fields"]
 
     @staticmethod
     def _get_attribute_schema(schema: Dict[str, Any], attribute: str) -> Dict[str, Any]:
         """Get the schema of the attribute."""
         attribute_schema = schema["properties"][attribute]
         if "$ref" in attribute_schema:
-            definition = re.sub("#/definitions/", "", attribute_schema["$ref"])
+            definition = attribute_schema["$ref"].replace("#/definitions/", "")
             attribute_schema = schema["definitions"][definition]
         elif (
             "type" in attribute_schema
             and attribute_schema["type"] == "array"
             and "$ref" in attribute_schema["items"]
         ):
-            definition = re.sub("#/definitions/", "", attribute_schema["items"]["$ref"])
-            attribute_schema = schema["definitions"][definition]
-            attribute_schema["type"] = "array"
+            definition = attribute_schema["items"]["$ref"].replace("#/definitions/", "")
+            # The schema is cached by pydantic, so the definition must not be changed.
+            attribute_schema = {**schema["definitions"][definition], "type": "array"}
         return attribute_schema
 
     def _ask_choice(
@@ -131,10 +151,7 @@ class PydanticQuestions(Prompter):
         Raises:
             KeyboardInterrupt: if the user canceled the fill up.
         """
-        try:
-            attribute_choices = list(choices[attribute].keys())
-        except KeyError:
-            attribute_choices = []
+        attribute_choices = list(choices.get(attribute, {}))
 
         if len(attribute_choices) == 0:
             if default is not None:
@@ -142,23 +159,11 @@ class PydanticQuestions(Prompter):
             else:
                 choice = text(question_text).unsafe_ask()
         else:
-            style = Style(
-                [
-                    ("separator", "bg:#002b36 fg:#cc5454"),
-                    ("qmark", "bg:#002b36  fg:#673ab7 bold"),
-                    ("question", "bg:#002b36 fg:#657b83"),
-                    ("selected", "fg:#657b83 bg:#002b36"),
-                    ("pointer", "fg:#673ab7 bold"),
-                    ("highlighted", "fg:#673ab7 bold"),
-                    ("answer", "bg:#002b36 #657b83"),
-                    ("text", "bg:#002b36 fg:#657b83"),
-                ]
-            )
             choice = autocomplete(
                 question_text,
                 choices=attribute_choices,
                 completer=FuzzyWordCompleter(attribute_choices),
-                style=style,
+                style=PROMPT_STYLE,
             ).unsafe_ask()
 
             if choice not in ["q", ""]:
@@ -48,12 +48,12 @@ RESOURCE_TYPES = {
     "sec": SecurityMeasure,
 }
 
-RESOURCE_NAMES = list(RESOURCE_TYPES.keys())
-MODELS = [value for _, value in RESOURCE_TYPES.items()]
+RESOURCE_NAMES = list(RESOURCE_TYPES)
+MODELS = list(RESOURCE_TYPES.values())
 
 Choices = Dict[str, Dict[str, Any]]
 
-__all__ = [
+__all__ = (
     "Authentication",
     "NetworkAccess",
     "EC2",
@@ -77,4 +77,4 @@ __all__ = [
     "EntityT",
     "EntityState",
     "EntityUpdate",
-]
+)
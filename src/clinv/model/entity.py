@@ -74,3 +74,12 @@ class EntityUpdate(BaseModel):
             values["model"] = values["data"].pop("model")
 
         return values
+
+    @classmethod
+    def from_data(cls, model: Type[Entity], data: Dict[str, Any]) -> "EntityUpdate":
+        """Build the update of an entity from trusted data.
+
+        The data is validated when the entity is built from it, so the update is
+        created without copying and validating it again.
+        """
+        return cls.construct(id_=data["id_"], model=model, data=data)
@@ -7,10 +7,11 @@ and handlers to achieve the program's purpose.
 import itertools
 import logging
 import operator
+from collections import Counter
 from contextlib import suppress
 from enum import EnumMeta
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Generator, Iterable, List, Optional, Type
 
 from pydantic import ValidationError
 from repository_orm import EntityNotFoundError, Repository
@@ -42,6 +43,34 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(__name__)
 
+# Models of the entities that can be chosen for each attribute of the models that
+# are filled up by the user.
+_ATTRIBUTE_MODELS: Dict[Type[Entity], Dict[str, Any]] = {
+    Project: {
+        "responsible": Person,
+        "services": Service,
+        "informations": Information,
+        "people": Person,
+    },
+    Service: {
+        "access": NetworkAccess,
+        "responsible": Person,
+        "authentication": Authentication,
+        "informations": Information,
+        "dependencies": Service,
+        "resources": (ASG, EC2, RDS, S3, IAMGroup, IAMUser, Route53),
+        "risks": Risk,
+        "security_measures": SecurityMeasure,
+        "environment": Environment,
+    },
+    Information: {
+        "responsible": Person,
+    },
+    Person: {
+        "iam_user": IAMUser,
+    },
+}
+
 
 def update_sources(
     repo: Repository,
@@ -56,19 +85,15 @@ def update_sources(
         resource_types: Only retrieve the state of these types.
     """
     models = _deduce_models(resource_types)
-    active_resources = [
-        entity for model in models for entity in repo.search({"state": "active"}, model)
-    ]
-    stopped_resources = [
-        entity
-        for model in models
-        for entity in repo.search({"state": "stopped"}, model)
-    ]
+    # Fetch the active and stopped entities of each model in a single query
+    active_resources = list(
+        itertools.chain.from_iterable(
+            repo.search({"state": "^(active|stopped)$"}, model) for model in models
+        )
+    )
 
     for source in adapter_sources:
-        source_updates = source.update(
-            resource_types, active_resources + stopped_resources
-        )
+        source_updates = source.update(resource_types, active_resources)
         for entity_data in track(source_updates, description="Updating repo data"):
             try:
                 entity = entity_data.model(**entity_data.data)
@@ -105,7 +130,9 @@ def list_entities(
     """
     models = _deduce_models(resource_types)
     entities = _filter_entities(
-        [entity for model in models for entity in repo.all(model)], all_, inactive
+        itertools.chain.from_iterable(repo.all(model) for model in models),
+        all_,
+        inactive,
     )
 
     if len(entities) == 0:
@@ -121,7 +148,7 @@ def list_entities(
 
 
 def _filter_entities(
-    entities: List[Entity], all_: bool = False, inactive: bool = False
+    entities: Iterable[Entity], all_: bool = False, inactive: bool = False
 ) -> List[Entity]:
     """Group by type and filter out entities that don't match the criteria.
 
@@ -131,22 +158,14 @@ def _filter_entities(
         all_: Whether to show active and inactive resources. Default: False
         inactive: Whether to show inactive resources. Default: False
     """
-    criteria = operator.attrgetter("model_name")
-    input_entities = sorted(entities, key=criteria)
-    entity_groups = {
-        sorted_key: list(element)
-        for sorted_key, element in itertools.groupby(input_entities, key=criteria)
-    }
-
     output_entities = []
-    for _, elements in entity_groups.items():
-        for element in elements:
-            if (element.state == "terminated" and not inactive and not all_) or (
-                element.state != "terminated" and inactive
-            ):
-                continue
+    for element in sorted(entities, key=operator.attrgetter("model_name")):
+        if (element.state == "terminated" and not inactive and not all_) or (
+            element.state != "terminated" and inactive
+        ):
+            continue
 
-            output_entities.append(element)
+        output_entities.append(element)
 
     return output_entities
 
@@ -200,24 +219,21 @@ def search(
     """
     models = _deduce_models(resource_types)
 
-    # Attributes to search
-    attributes: List[str] = []
-    for model in models:
-        for attribute in model.schema()["properties"].keys():
-            # Until https://github.com/lyz-code/repository-orm/issues/15 is
-            # fixed we can't search by the egress and ingress of the
-            # security groups
-            if attribute not in attributes + ["egress", "ingress"]:
-                attributes.append(attribute)
-
     entities: List[Entity] = []
     for model in models:
+        # Only search by the attributes of the model, as the rest can't match.
+        # Until https://github.com/lyz-code/repository-orm/issues/15 is
+        # fixed we can't search by the egress and ingress of the
+        # security groups
+        attributes = [
+            attribute
+            for attribute in model.schema()["properties"]
+            if attribute not in ("egress", "ingress")
+        ]
         new_entities = _filter_entities(
-            [
-                entity
-                for attribute in attributes
-                for entity in repo.search({attribute: regexp}, model)
-            ],
+            itertools.chain.from_iterable(
+                repo.search({attribute: regexp}, model) for attribute in attributes
+            ),
             all_,
             inactive,
         )
@@ -276,41 +292,12 @@ def unused(
 
 def build_choices(repo: Repository, config: "Config", model: Type[Entity]) -> Choices:
     """Create the possible choices of the attributes of a model."""
-    choices: Choices = {}
-
     # Build choices from models
-    if model == Project:
-        attribute_models: Dict[str, Any] = {
-            "responsible": Person,
-            "services": Service,
-            "informations": Information,
-            "people": Person,
-        }
-    elif model == Service:
-        attribute_models = {
-            "access": NetworkAccess,
-            "responsible": Person,
-            "authentication": Authentication,
-            "informations": Information,
-            "dependencies": Service,
-            "resources": (ASG, EC2, RDS, S3, IAMGroup, IAMUser, Route53),
-            "risks": Risk,
-            "security_measures": SecurityMeasure,
-            "environment": Environment,
-        }
-    elif model == Information:
-        attribute_models = {
-            "responsible": Person,
-        }
-    elif model == Person:
-        attribute_models = {
-            "iam_user": IAMUser,
-        }
-    else:
-        attribute_models = {}
-
-    for key, value in attribute_models.items():
-        choices[key] = _build_attribute_choices(repo=repo, model=value)
+    attribute_models = _ATTRIBUTE_MODELS.get(model, {})
+    choices: Choices = {
+        key: _build_attribute_choices(repo=repo, model=value)
+        for key, value in attribute_models.items()
+    }
 
     # Build choices from config
     if model == Service:
@@ -328,21 +315,24 @@ def _build_attribute_choices(
     model_name: bool = False,
 ) -> Dict[str, Any]:
     """Create the possible choices of the attributes of the project model."""
-    choices: Dict[str, str] = {}
     if isinstance(model, tuple):
+        choices: Dict[str, str] = {}
         for item in model:
             choices.update(_build_attribute_choices(repo, item, model_name=True))
         return choices
     if isinstance(model, type(Entity)):
-        for entity in repo.search({"state": "active"}, model):
-            if entity.name is None:
-                continue
-            if model_name:
-                name = f"{entity.name} ({entity.model_name})"
-            else:
-                name = entity.name
-            choices[name] = str(entity.id_)
-        return choices
+        entities = repo.search({"state": "active"}, model)
+        if model_name:
+            return {
+                f"{entity.name} ({entity.model_name})": str(entity.id_)
+                for entity in entities
+                if entity.name is not None
+            }
+        return {
+            entity.name: str(entity.id_)
+            for entity in entities
+            if entity.name is not None
+        }
     if isinstance(model, EnumMeta):
         return {  # type: ignore
             str(attribute.value): str(attribute.value) for attribute in model
@@ -387,12 +377,10 @@ def service_risk(repo: Repository) -> List[Service]:
     risks = {
         risk.id_: risk.security_value for risk in repo.search({"state": "active"}, Risk)
     }
-    dependencies = {
-        service.id_: len(
-            [service_ for service_ in services if service.id_ in service_.dependencies]
-        )
-        for service in services
-    }
+    # Number of services that depend on each service
+    dependencies = Counter(
+        itertools.chain.from_iterable(set(service.dependencies) for service in services)
+    )
 
     # W0212: Access of a protected attribute of service, but it's a property we
     # control so there is no problem
@@ -20,12 +20,12 @@ def print_entity(entity: "Entity") -> None:
         entity: Entity whose attributes to print.
     """
     data = get_data_to_print(entity)
-    console = Console()
 
     # There are two types of data to print, one contains the attributes of an
     # element, and the other contains a list of element attributes. The last case
     # is common of attributes that contain a list of other Pydantic objects.
 
+    tables = []
     for attr_group in data:
         model_name = attr_group.pop("_model_name")
 
@@ -44,7 +44,11 @@ def print_entity(entity: "Entity") -> None:
             for attribute, value in attr_group.items():
                 table.add_row(attribute, value)
 
-        console.print(table)
+        tables.append(table)
+
+    # Render all the tables at once to write the output in a single call
+    console = Console()
+    console.print(*tables)
 
 
 def list_entities(entities: List["Entity"]) -> None:
@@ -113,7 +117,7 @@ def get_data_to_print(entity: "Entity") -> List[Dict[str, Any]]:  # noqa: R0912
 
                     for sub_value in value:
                         row = []
-                        for _, sub_attr in sub_value.items():
+                        for sub_attr in sub_value.values():
                             if sub_attr is None or isinstance(sub_attr, (str, int)):
                                 row.append(sub_attr)
                             elif isinstance(sub_attr, list):
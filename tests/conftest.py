@@ -2,13 +2,14 @@
 
 import os
 from pathlib import Path
-from typing import Any, Dict, Generator
+from typing import Any, Dict, Generator, List
 
 import boto3
 import pytest
 from moto import mock_autoscaling, mock_ec2, mock_iam, mock_rds, mock_route53, mock_s3
 from repository_orm import FakeRepository, TinyDBRepository
 
+from clinv.adapters.aws import _client
 from clinv.adapters.fake import FakeSource
 from clinv.config import Config
 
@@ -71,6 +72,20 @@ def source_() -> FakeSource:
 
 
 # AWS fixtures
+@pytest.fixture(autouse=True)
+def _clear_aws_clients() -> Generator[None, None, None]:
+    """Don't reuse the AWS clients cached by the adapter between tests.
+
+    The clients are bound to the credentials and moto mocks of the test that created
+    them.
+    """
+    _client.cache_clear()
+
+    yield
+
+    _client.cache_clear()
+
+
 @pytest.fixture()
 def _aws_credentials() -> None:
     """Mock the AWS Credentials for moto."""
@@ -138,3 +153,24 @@ def all_aws_(  # noqa: R0913
         "route53": route53,
         "s3": s3_mock,
     }
+
+
+@pytest.fixture(name="describe_regions_calls")
+def describe_regions_calls_(
+    _aws_credentials: None, monkeypatch: pytest.MonkeyPatch
+) -> List[Dict[str, Any]]:
+    """Record the calls to describe_regions of the client used by the AWS adapter.
+
+    Returns:
+        calls: Arguments of each describe_regions call.
+    """
+    client = _client("ec2", "us-east-1")
+    describe_regions = client.describe_regions
+    calls: List[Dict[str, Any]] = []
+
+    def spy(**kwargs: Any) -> Any:
+        calls.append(kwargs)
+        return describe_regions(**kwargs)
+
+    monkeypatch.setattr(client, "describe_regions", spy)
+    return calls
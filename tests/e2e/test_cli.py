@@ -3,6 +3,7 @@
 import logging
 import re
 import sys
+from pathlib import Path
 from typing import Any, Generator
 
 import pexpect  # noqa: E0401
@@ -75,6 +76,42 @@ def test_version(runner: CliRunner) -> None:
     )
 
 
+def test_creates_the_database_directory_if_it_doesnt_exist(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Given: A database url whose directory doesn't exist
+    When: Running a command
+    Then: The directory is created and the command works.
+    """
+    database_directory = tmp_path / "data"
+    monkeypatch.setenv(
+        "DATABASE_URL", f"tinydb:///{database_directory}/database.tinydb"
+    )
+
+    result = runner.invoke(cli, ["update", "per"])
+
+    assert result.exit_code == 0
+    assert (database_directory / "database.tinydb").is_file()
+
+
+def test_accepts_database_urls_relative_to_the_working_directory(
+    runner: CliRunner, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Given: A database url without directory
+    When: Running a command
+    Then: The database is created in the working directory and the command works.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("DATABASE_URL", "tinydb://database.tinydb")
+
+    result = runner.invoke(cli, ["update", "per"])
+
+    assert result.exit_code == 0
+    assert (tmp_path / "database.tinydb").is_file()
+
+
 class TestUpdate:
     """Test the command line to update the resources information."""
 
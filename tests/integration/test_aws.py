@@ -1,10 +1,11 @@
 """Test the AWS adapter."""
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 import pytest
 
+from clinv.adapters import aws as aws_adapter
 from clinv.adapters.aws import AWSSource
 from clinv.model import EntityUpdate, aws
 
@@ -66,6 +67,34 @@ def test_update_creates_ec2_instances_with_minimum_parameters(ec2: Any) -> None:
     assert aws.EC2(**entity_data).id_ == instance["InstanceId"]
 
 
+@pytest.mark.slow()
+def test_update_creates_ec2_instances_with_an_association_without_public_ip(
+    ec2: Any, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """
+    Given: An ec2 instance whose address association has no public ip, like the
+        Wavelength carrier ips.
+    When: adapter's update method is called
+    Then: the ec2 data is extracted without public ips.
+    """
+    image_id = ec2.describe_images()["Images"][0]["ImageId"]
+    ec2.run_instances(ImageId=image_id, MinCount=1, MaxCount=1)
+    instance = ec2.describe_instances()["Reservations"][0]["Instances"][0]
+    instance["NetworkInterfaces"][0]["PrivateIpAddresses"][0]["Association"] = {
+        "CarrierIp": "192.0.2.1"
+    }
+    monkeypatch.setattr(
+        aws_adapter,
+        "_fetch_ec2_instances",
+        lambda region: [instance] if region == "us-east-1" else [],
+    )
+
+    result = AWSSource().update(["ec2"])
+
+    assert len(result) == 1
+    assert result[0].data["public_ips"] == []
+
+
 @pytest.mark.slow()
 def test_update_handles_no_ec2_in_zone(ec2: Any) -> None:
     """
@@ -348,7 +377,7 @@ def test_update_creates_route53_instances(route53: Any) -> None:
     assert aws.Route53(**entity_data).id_ == entity_data["id_"]
 
 
-@pytest.mark.skip("Until https://github.com/spulec/moto/issues/3879 is solved.")
+@pytest.mark.slow()
 def test_update_creates_route53_instances_when_there_are_a_lot(route53: Any) -> None:
     """
     Given: A working adapter and many route53 record
@@ -367,10 +396,10 @@ def test_update_creates_route53_instances_when_there_are_a_lot(route53: Any) ->
                     {
                         "Action": "CREATE",
                         "ResourceRecordSet": {
-                            "Name": "example.com",
+                            "Name": f"host-{counter}.example.com",
                             "ResourceRecords": [
                                 {
-                                    "Value": f"192.0.2.{counter}",
+                                    "Value": f"192.0.2.{counter % 256}",
                                 },
                             ],
                             "TTL": 60,
@@ -385,7 +414,8 @@ def test_update_creates_route53_instances_when_there_are_a_lot(route53: Any) ->
 
     result = AWSSource().update(["r53"])
 
-    assert len(result) == 256
+    # The 400 created records plus the default NS and SOA ones
+    assert len(result) == 402
 
 
 @pytest.mark.secondary()
@@ -528,6 +558,23 @@ def test_update_creates_vpc_instances(ec2: Any) -> None:
     assert aws.VPC(**entity_data).id_ == entity_data["id_"]
 
 
+def test_update_assigns_the_subnets_to_their_vpc(ec2: Any) -> None:
+    """
+    Given: A working adapter and two vpcs, one of them with a subnet.
+    When: adapter's update method is called
+    Then: each vpc only has its own subnets.
+    """
+    vpc = ec2.create_vpc(CidrBlock="172.16.0.0/16")["Vpc"]
+    empty_vpc = ec2.create_vpc(CidrBlock="172.17.0.0/16")["Vpc"]
+    subnet = ec2.create_subnet(VpcId=vpc["VpcId"], CidrBlock="172.16.1.0/24")["Subnet"]
+
+    result = AWSSource().update(["vpc"])
+
+    subnets = {update.id_: update.data["subnets"] for update in result}
+    assert subnets[vpc["VpcId"]] == [subnet["SubnetId"]]
+    assert subnets[empty_vpc["VpcId"]] == []
+
+
 @pytest.mark.slow()
 def test_update_creates_autoscaling_groups(ec2: Any, autoscaling: Any) -> None:
     """
@@ -738,3 +785,38 @@ def test_update_doesnt_marks_unprocessed_resources_as_terminated(
     result = AWSSource().update(["rds"], [entity])
 
     assert len(result) == 0
+
+
+def test_regions_are_fetched_only_once(
+    ec2: Any,  # noqa: W0613
+    describe_regions_calls: List[Dict[str, Any]],
+) -> None:
+    """
+    Given: A working adapter
+    When: the regions are accessed twice and regional resources are updated
+    Then: the regions are requested only once
+    """
+    source = AWSSource()
+    regions = source.regions
+
+    source.update(["ec2", "vpc"])  # act
+
+    assert source.regions == regions
+    assert len(describe_regions_calls) == 1
+
+
+def test_update_of_global_resources_doesnt_fetch_the_regions(
+    iam: Any,  # noqa: W0613
+    describe_regions_calls: List[Dict[str, Any]],
+) -> None:
+    """
+    Given: A working adapter
+    When: only resources of global services are updated
+    Then: the regions are not requested
+    """
+    source = AWSSource()
+
+    result = source.update(["iamu"])
+
+    assert result == []
+    assert describe_regions_calls == []
@@ -1,6 +1,8 @@
 """Test the AWS adapter particular cases."""
 
-from clinv.adapters.aws import build_security_group_rule_data
+import pytest
+
+from clinv.adapters.aws import _client, build_security_group_rule_data
 
 
 def test_build_sg_rules_extracts_description_from_ip_range() -> None:
@@ -83,3 +85,22 @@ def test_build_sg_rules_extracts_icmp_ports() -> None:
 
     assert result["protocol"] == "ICMP"
     assert result["ports"] == [-2]
+
+
+@pytest.mark.usefixtures("_aws_credentials")
+def test_client_retries_only_the_requests_of_global_services() -> None:
+    """
+    Given: A global AWS service whose requests are done concurrently, and a regional
+        one
+    When: _client is called for each of them
+    Then: Only the client of the global service retries the failed requests, like
+        the throttled ones. The regional one fails fast when the region is
+        unreachable.
+    """
+    global_client = _client("iam")
+
+    regional_client = _client("ec2", "us-east-1")
+
+    assert global_client.meta.config.retries["mode"] == "standard"
+    assert global_client.meta.config.retries["total_max_attempts"] == 5
+    assert regional_client.meta.config.retries["total_max_attempts"] == 1
@@ -0,0 +1,54 @@
+"""Test the loading of the source adapters."""
+
+import pytest
+
+from clinv import adapters
+from clinv.adapters import AVAILABLE_SOURCES, AbstractSource, get_source
+
+
+@pytest.mark.parametrize("source_name", list(AVAILABLE_SOURCES))
+def test_get_source_imports_the_registered_adapters(source_name: str) -> None:
+    """
+    Given: The name of a registered source adapter
+    When: get_source is called
+    Then: The class of the import path of the adapter is returned.
+    """
+    class_name = AVAILABLE_SOURCES[source_name].split(":")[1]
+
+    result = get_source(source_name)
+
+    assert issubclass(result, AbstractSource)
+    assert result.__name__ == class_name
+
+
+def test_get_source_raises_error_for_unknown_adapters() -> None:
+    """
+    Given: The name of a source adapter that isn't registered
+    When: get_source is called
+    Then: A KeyError is raised.
+    """
+    with pytest.raises(KeyError):
+        get_source("inexistent")
+
+
+def test_adapter_classes_can_be_imported_from_the_package() -> None:
+    """
+    Given: Nothing
+    When: A source adapter class is imported from the adapters package
+    Then: It's the class of its module.
+    """
+    from clinv.adapters.aws import AWSSource as ModuleAWSSource  # noqa: C0415
+
+    from clinv.adapters import AWSSource  # noqa: C0415 # act
+
+    assert AWSSource is ModuleAWSSource
+
+
+def test_package_raises_error_for_unknown_attributes() -> None:
+    """
+    Given: Nothing
+    When: An attribute that doesn't exist is accessed in the adapters package
+    Then: An AttributeError is raised.
+    """
+    with pytest.raises(AttributeError, match="has no attribute 'InexistentSource'"):
+        adapters.InexistentSource  # noqa: B018
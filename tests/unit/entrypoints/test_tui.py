@@ -0,0 +1,113 @@
+"""Test the TUI interfaces."""
+
+import copy
+from typing import Any, Dict, List, Optional
+
+import pytest
+from pydantic import Field
+
+from clinv.entrypoints import tui
+from clinv.entrypoints.tui import PydanticQuestions
+from clinv.model import Choices, Information
+from clinv.model.entity import Entity, EntityState, Environment
+from clinv.model.risk import InformationID, PersonID
+
+
+class Deployment(Entity):
+    """Define an entity with a list of enum attributes."""
+
+    environments: List[Environment] = Field(default_factory=list)
+
+
+class FakeQuestion:
+    """Replace the questionary questions with a given answer."""
+
+    def __init__(self, answer: Any) -> None:
+        """Store the answer to return."""
+        self.answer = answer
+
+    def unsafe_ask(self) -> Any:
+        """Return the stored answer."""
+        return self.answer
+
+
+class FakeUser:
+    """Answer the TUI questions with the given answers, recording what was asked."""
+
+    def __init__(self, answers: Dict[str, List[str]]) -> None:
+        """Store the answers of each attribute, in the order they are given."""
+        self.answers = answers
+        self.asked: List[str] = []
+
+    def ask_choice(
+        self,
+        question_text: str,  # noqa: W0613
+        attribute: str,
+        choices: Choices,  # noqa: W0613
+        default: Optional[str] = None,  # noqa: W0613
+    ) -> str:
+        """Return the next answer of the attribute."""
+        self.asked.append(attribute)
+        return self.answers[attribute].pop(0)
+
+    def confirm(self, question_text: str) -> FakeQuestion:  # noqa: W0613
+        """Accept the only boolean attribute of Information, personal_data."""
+        self.asked.append("personal_data")
+        return FakeQuestion(True)
+
+
+def test_fill_asks_again_only_the_invalid_attributes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Given: A user that enters an invalid responsible and then a valid one
+    When: fill is called
+    Then: Only the invalid attribute is asked again, and the entity is built.
+    """
+    user = FakeUser(
+        {
+            "name": ["Data"],
+            "description": ["Description"],
+            "responsible": ["invalid_responsible", "per_001"],
+        }
+    )
+    monkeypatch.setattr(PydanticQuestions, "_ask_choice", user.ask_choice)
+    monkeypatch.setattr(tui, "confirm", user.confirm)
+
+    result = PydanticQuestions().fill(
+        model=Information, entity_data={"id_": "inf_001", "state": EntityState.RUNNING}
+    )
+
+    assert result == Information(
+        id_=InformationID("inf_001"),
+        state=EntityState.RUNNING,
+        name="Data",
+        description="Description",
+        responsible=PersonID("per_001"),
+        personal_data=True,
+    )
+    assert user.asked == [
+        "name",
+        "description",
+        "responsible",
+        "personal_data",
+        "responsible",
+    ]
+
+
+def test_get_attribute_schema_doesnt_change_the_model_schema() -> None:
+    """
+    Given: A model with a list of enum attributes
+    When: _get_attribute_schema is called for that attribute
+    Then: The array type is returned, but the cached model schema is not modified.
+    """
+    schema = Deployment.schema()
+    definitions = copy.deepcopy(schema["definitions"])
+
+    result = PydanticQuestions._get_attribute_schema(  # noqa: W0212
+        schema, "environments"
+    )
+
+    assert result["type"] == "array"
+    assert result["enum"] == [environment.value for environment in Environment]
+    assert Deployment.schema()["definitions"] == definitions
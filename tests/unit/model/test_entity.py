@@ -0,0 +1,18 @@
+"""Test the implementation of the generic entity models."""
+
+from clinv.model import aws
+from clinv.model.entity import EntityUpdate
+
+
+def test_entity_update_from_data_matches_the_validated_update() -> None:
+    """
+    Given: The data of an entity
+    When: Building the update with from_data
+    Then: It's equal to the update built through the validators.
+    """
+    entity_data = {"id_": "i-01", "state": "active"}
+
+    result = EntityUpdate.from_data(aws.EC2, entity_data)
+
+    assert result == EntityUpdate(model=aws.EC2, data=entity_data)
+    assert result.id_ == "i-01"